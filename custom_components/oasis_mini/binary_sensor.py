@@ -24,12 +24,14 @@ async def async_setup_entry(
     """Set up Oasis Mini sensors using config entry."""
     coordinator: OasisMiniCoordinator = entry.runtime_data
     async_add_entities(
-        OasisMiniBinarySensorEntity(coordinator, descriptor)
-        for descriptor in DESCRIPTORS
+        [
+            OasisMiniBinarySensorEntity(coordinator, descriptor)
+            for descriptor in DESCRIPTORS
+        ]
     )
 
 
-DESCRIPTORS = {
+DESCRIPTORS = (
     BinarySensorEntityDescription(
         key="busy",
         translation_key="busy",
@@ -43,7 +45,7 @@ DESCRIPTORS = {
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
-}
+)
 
 
 class OasisMiniBinarySensorEntity(OasisMiniEntity, BinarySensorEntity):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 
@@ -40,13 +41,17 @@ class OasisMiniCoordinator(DataUpdateCoordinator[str]):
 
         try:
             async with async_timeout.timeout(10):
-                if not self.device.mac_address:
-                    await self.device.async_get_mac_address()
-                if not self.device.serial_number:
-                    await self.device.async_get_serial_number()
-                if not self.device.software_version:
-                    await self.device.async_get_software_version()
-                data = await self.device.async_get_status()
+                device = self.device
+                # Identity lookups only run until they succeed, so on the first
+                # update fetch them alongside the status instead of one by one
+                requests = [device.async_get_status()]
+                if not device.mac_address:
+                    requests.append(device.async_get_mac_address())
+                if not device.serial_number:
+                    requests.append(device.async_get_serial_number())
+                if not device.software_version:
+                    requests.append(device.async_get_software_version())
+                data = (await asyncio.gather(*requests))[0]
                 self.attempt = 0
                 await self.device.async_get_current_track_details()
                 await self.device.async_get_playlist_details()
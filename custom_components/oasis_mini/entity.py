@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, format_mac
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -40,3 +41,26 @@ class OasisMiniEntity(CoordinatorEntity[OasisMiniCoordinator]):
     def device(self) -> OasisMini:
         """Return the device."""
         return self.coordinator.device
+
+    @callback
+    def async_push_device_state(self, refresh: bool = True) -> None:
+        """Push the locally updated device state to all entities.
+
+        If `refresh` is True, a refresh is scheduled in the background to
+        reconcile with the device.
+        """
+        self.coordinator.async_update_listeners()
+        if refresh:
+            self.hass.async_create_background_task(
+                self._async_reconcile_device_state(), f"{DOMAIN} refresh"
+            )
+
+    async def _async_reconcile_device_state(self) -> None:
+        """Refresh from the device and notify listeners even if nothing changed.
+
+        The coordinator only notifies on changed data, which would leave
+        optimistic state visible when the device ignored a command.
+        """
+        coordinator = self.coordinator
+        await coordinator.async_refresh()
+        coordinator.async_update_listeners()
@@ -3,32 +3,53 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 from homeassistant.const import CONF_ACCESS_TOKEN, CONF_HOST
 
-from .pyoasismini import TRACKS, OasisMini
+from .pyoasismini import STATUS_PLAYING, TRACKS, OasisMini
 
 _LOGGER = logging.getLogger(__name__)
 
+TRACK_ID_LIST_RE = re.compile(r"\s*\d+(?:\s*,\s*\d+)*\s*")
+DIGITS_RE = re.compile(r"\d+")
+
+TRACK_IDS = frozenset(map(str, TRACKS))
+# Reversed so the first track wins when names are duplicated
+TRACK_NAMES = {
+    info["name"].lower(): id for id, info in reversed(TRACKS.items()) if "name" in info
+}
+
 
 def create_client(data: dict[str, Any]) -> OasisMini:
     """Create a Oasis Mini local client."""
     return OasisMini(data[CONF_HOST], data.get(CONF_ACCESS_TOKEN))
 
 
-async def add_and_play_track(device: OasisMini, track: int) -> None:
-    """Add and play a track."""
-    if track not in device.playlist:
-        await device.async_add_track_to_playlist(track)
+async def add_and_play_track(
+    device: OasisMini, track: int | list[int], play: bool = True
+) -> None:
+    """Add track(s) after the current track and optionally play them.
 
-    # Move track to next item in the playlist and then select it
-    if (index := device.playlist.index(track)) != device.playlist_index:
-        if index != (_next := min(device.playlist_index + 1, len(device.playlist) - 1)):
+    A single track already in the playlist is moved instead of added again.
+    """
+    if isinstance(track, int) and track in device.playlist:
+        index = device.playlist.index(track)
+        last = len(device.playlist) - 1
+    else:
+        tracks = [track] if isinstance(track, int) else track
+        await device.async_add_track_to_playlist(tracks)
+        index = last = len(device.playlist) - len(tracks)
+
+    # Move the first track to the next item in the playlist and then select it
+    if index != (current := device.playlist_index):
+        if index != (_next := min(current + 1, last)):
             await device.async_move_track(index, _next)
-        await device.async_change_track(_next)
+        if play:
+            await device.async_change_track(_next)
 
-    if device.status_code != 4:
+    if play and device.status_code != STATUS_PLAYING:
         await device.async_play()
 
 
@@ -38,13 +59,26 @@ def get_track_id(track: str) -> int | None:
     `track` can be either an id or title
     """
     track = track.lower().strip()
-    if track not in map(str, TRACKS):
-        track = next(
-            (id for id, info in TRACKS.items() if info["name"].lower() == track), track
-        )
-
-    try:
+    if track not in TRACK_IDS and (track_id := TRACK_NAMES.get(track)) is not None:
+        return track_id
+    if track.isdecimal():
         return int(track)
-    except ValueError:
-        _LOGGER.warning("Invalid track: %s", track)
-        return None
+
+    _LOGGER.warning("Invalid track: %s", track)
+    return None
+
+
+def get_track_ids(tracks: str) -> list[int]:
+    """Get track ids from a comma separated string.
+
+    Each item in `tracks` can be either an id or title
+    """
+    # Only known ids take the fast path, all-digit titles (e.g. "2025") need the
+    # name lookup in get_track_id
+    if TRACK_ID_LIST_RE.fullmatch(tracks) and TRACK_IDS.issuperset(
+        ids := DIGITS_RE.findall(tracks)
+    ):
+        return [track for track in map(int, ids) if track]
+    if "," in tracks:
+        return [track for item in tracks.split(",") if (track := get_track_id(item))]
+    return [track] if (track := get_track_id(tracks)) else []
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.components.image import Image, ImageEntity, ImageEntityDescription
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -20,6 +22,7 @@ class OasisMiniImageEntity(OasisMiniEntity, ImageEntity):
     """Oasis Mini image entity."""
 
     _attr_content_type = "image/svg+xml"
+    _render_task: asyncio.Task[None] | None = None
     _track_id: int | None = None
     _progress: int = 0
 
@@ -29,42 +32,92 @@ class OasisMiniImageEntity(OasisMiniEntity, ImageEntity):
         """Initialize the entity."""
         super().__init__(coordinator, description)
         ImageEntity.__init__(self, coordinator.hass)
-        self._handle_coordinator_update()
+        self._update_attrs()
 
     def image(self) -> bytes | None:
         """Return bytes of image."""
-        if not self._cached_image:
-            self._cached_image = Image(
-                self.content_type, draw_svg(self.device.track, self._progress, "1")
-            )
-        return self._cached_image.content
+        if (image := self._cached_image) is None:
+            image = self._cached_image = self._render_image()
+        return image.content
+
+    def _render_image(self) -> Image:
+        """Render the current track progress."""
+        return Image(
+            self.content_type, draw_svg(self.device.track, self._progress, "1")
+        )
+
+    async def _async_render_image(self) -> None:
+        """Render the image in the executor so requests are served from cache."""
+        try:
+            while self._cached_image is None:
+                rendering = (self._track_id, self._progress)
+                image = await self.hass.async_add_executor_job(self._render_image)
+                # Discard the result if the track or progress changed meanwhile
+                if rendering == (self._track_id, self._progress):
+                    self._cached_image = image
+        finally:
+            self._render_task = None
+
+    @callback
+    def _async_schedule_render(self) -> None:
+        """Start rendering the image unless a render is already running."""
+        if self._render_task:
+            return
+        task = self.hass.async_create_task(self._async_render_image())
+        # An eagerly started render may already have finished
+        if not task.done():
+            self._render_task = task
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_render)
+        # The initial attributes were set before hass was available
+        if (
+            self._cached_image is None
+            and (track := self.device.track)
+            and track.get("svg_content")
+        ):
+            self._async_schedule_render()
+
+    @callback
+    def _async_cancel_render(self) -> None:
+        """Cancel a pending render when the entity is removed."""
+        if self._render_task:
+            self._render_task.cancel()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if (
-            self._track_id != self.device.track_id
-            or (self._progress != self.device.progress and self.device.access_token)
-        ) and (self.device.status == "playing" or self._cached_image is None):
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the image attributes from the device."""
+        device = self.device
+        track_id = device.track_id
+        progress = device.progress
+        if (device.status == "playing" or self._cached_image is None) and (
+            self._track_id != track_id
+            or (progress != self._progress and device.access_token)
+        ):
             self._attr_image_last_updated = self.coordinator.last_updated
-            self._track_id = self.device.track_id
-            self._progress = self.device.progress
+            self._track_id = track_id
+            self._progress = progress
             self._cached_image = None
-            if self.device.track and self.device.track.get("svg_content"):
+            track = device.track
+            if track and track.get("svg_content"):
                 self._attr_image_url = UNDEFINED
+                if self.hass:
+                    self._async_schedule_render()
             else:
                 self._attr_image_url = (
                     f"https://app.grounded.so/uploads/{track['image']}"
-                    if (
-                        track := (self.device.track or TRACKS.get(self.device.track_id))
-                    )
-                    and "image" in track
+                    if (track := (track or TRACKS.get(track_id))) and "image" in track
                     else None
                 )
 
-        if self.hass:
-            super()._handle_coordinator_update()
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
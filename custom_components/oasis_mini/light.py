@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import math
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -27,28 +28,32 @@ from . import OasisMiniConfigEntry
 from .entity import OasisMiniEntity
 from .pyoasismini import LED_EFFECTS
 
+BRIGHTNESS_ONLY_EFFECTS: Final = frozenset(
+    {"Rainbow", "Glitter", "Confetti", "BPM", "Juggle"}
+)
+
+
+@lru_cache(maxsize=256)
+def _rgb_to_hex(r: int, g: int, b: int) -> str:
+    """Convert an rgb color to a #-prefixed hex string."""
+    return f"#{color_rgb_to_hex(r, g, b)}"
+
 
 class OasisMiniLightEntity(OasisMiniEntity, LightEntity):
     """Oasis Mini light entity."""
 
     _attr_supported_features = LightEntityFeature.EFFECT
+    _brightness_scale: tuple[int, int] | None = None
 
     @property
     def brightness(self) -> int:
         """Return the brightness of this light between 0..255."""
-        scale = (1, self.device.max_brightness)
-        return value_to_brightness(scale, self.device.brightness)
+        return value_to_brightness(self._get_brightness_scale(), self.device.brightness)
 
     @property
     def color_mode(self) -> ColorMode:
         """Return the color mode of the light."""
-        if self.effect in (
-            "Rainbow",
-            "Glitter",
-            "Confetti",
-            "BPM",
-            "Juggle",
-        ):
+        if self.effect in BRIGHTNESS_ONLY_EFFECTS:
             return ColorMode.BRIGHTNESS
         return ColorMode.RGB
 
@@ -70,40 +75,55 @@ class OasisMiniLightEntity(OasisMiniEntity, LightEntity):
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the rgb color value [int, int, int]."""
-        if not self.device.color:
+        if not (color := self.device.color):
             return None
-        return rgb_hex_to_rgb_list(self.device.color.replace("#", ""))
+        return rgb_hex_to_rgb_list(color.replace("#", ""))
 
     @property
     def supported_color_modes(self) -> set[ColorMode]:
         """Flag supported color modes."""
         return {ColorMode.RGB}
 
+    def _get_brightness_scale(self) -> tuple[int, int]:
+        """Return the device brightness scale, rebuilt only when the max changes."""
+        max_brightness = self.device.max_brightness
+        if not (scale := self._brightness_scale) or scale[1] != max_brightness:
+            scale = self._brightness_scale = (1, max_brightness)
+        return scale
+
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
         await self.device.async_set_led(brightness=0)
-        await self.coordinator.async_request_refresh()
+        self.async_push_device_state(refresh=False)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
+        device = self.device
         if brightness := kwargs.get(ATTR_BRIGHTNESS):
-            scale = (1, self.device.max_brightness)
+            scale = self._get_brightness_scale()
             brightness = math.ceil(brightness_to_value(scale, brightness))
         else:
-            brightness = self.device.brightness or 100
+            brightness = device.brightness or 100
 
         if color := kwargs.get(ATTR_RGB_COLOR):
-            color = f"#{color_rgb_to_hex(*color)}"
+            color = _rgb_to_hex(*color)
 
         if led_effect := kwargs.get(ATTR_EFFECT):
             led_effect = next(
                 (k for k, v in LED_EFFECTS.items() if v == led_effect), None
             )
 
-        await self.device.async_set_led(
+        if (
+            brightness == device.brightness
+            and color in (None, device.color)
+            and led_effect in (None, device.led_effect)
+        ):
+            return
+
+        await device.async_set_led(
             brightness=brightness, color=color, led_effect=led_effect
         )
-        await self.coordinator.async_request_refresh()
+        self.async_push_device_state(refresh=False)
 
 
 DESCRIPTOR = LightEntityDescription(key="led", translation_key="led")
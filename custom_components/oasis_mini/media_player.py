@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.media_player import (
     MediaPlayerEnqueue,
@@ -21,46 +21,73 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import OasisMiniConfigEntry
 from .const import DOMAIN
 from .entity import OasisMiniEntity
-from .helpers import get_track_id
+from .helpers import add_and_play_track, get_track_ids
+from .pyoasismini import (
+    STATUS_CENTERING,
+    STATUS_DOWNLOADING,
+    STATUS_ERROR,
+    STATUS_LIVE,
+    STATUS_PAUSED,
+    STATUS_PLAYING,
+    STATUS_STOPPED,
+    STATUS_UPDATING,
+    OasisMini,
+)
 from .pyoasismini.const import TRACKS
 
+SUPPORTED_FEATURES: Final = (
+    MediaPlayerEntityFeature.PAUSE
+    | MediaPlayerEntityFeature.PLAY
+    | MediaPlayerEntityFeature.STOP
+    | MediaPlayerEntityFeature.PREVIOUS_TRACK
+    | MediaPlayerEntityFeature.NEXT_TRACK
+    | MediaPlayerEntityFeature.PLAY_MEDIA
+    | MediaPlayerEntityFeature.MEDIA_ENQUEUE
+    | MediaPlayerEntityFeature.CLEAR_PLAYLIST
+    | MediaPlayerEntityFeature.REPEAT_SET
+)
+
+STATE_MAP: Final[dict[int, MediaPlayerState]] = {
+    STATUS_STOPPED: MediaPlayerState.IDLE,
+    STATUS_CENTERING: MediaPlayerState.BUFFERING,
+    STATUS_PLAYING: MediaPlayerState.PLAYING,
+    STATUS_PAUSED: MediaPlayerState.PAUSED,
+    STATUS_ERROR: MediaPlayerState.OFF,
+    STATUS_UPDATING: MediaPlayerState.OFF,
+    STATUS_DOWNLOADING: MediaPlayerState.BUFFERING,
+    STATUS_LIVE: MediaPlayerState.ON,
+}
+
 
 class OasisMiniMediaPlayerEntity(OasisMiniEntity, MediaPlayerEntity):
     """Oasis Mini media player entity."""
 
+    _attr_media_content_type = MediaType.IMAGE
     _attr_media_image_remotely_accessible = True
-    _attr_supported_features = (
-        MediaPlayerEntityFeature.PAUSE
-        | MediaPlayerEntityFeature.PLAY
-        | MediaPlayerEntityFeature.STOP
-        | MediaPlayerEntityFeature.PREVIOUS_TRACK
-        | MediaPlayerEntityFeature.NEXT_TRACK
-        | MediaPlayerEntityFeature.PLAY_MEDIA
-        | MediaPlayerEntityFeature.MEDIA_ENQUEUE
-        | MediaPlayerEntityFeature.CLEAR_PLAYLIST
-        | MediaPlayerEntityFeature.REPEAT_SET
-    )
-
-    @property
-    def media_content_type(self) -> MediaType:
-        """Content type of current playing media."""
-        return MediaType.IMAGE
+    _attr_supported_features = SUPPORTED_FEATURES
+    _image_url_cache: tuple[str | None, str | None] = (None, None)
 
     @property
     def media_duration(self) -> int | None:
         """Duration of current playing media in seconds."""
-        if (track := self.device.track) and "reduced_svg_content" in track:
-            return track["reduced_svg_content"].get("1")
-        return None
+        if (track := self.device.track) is None:
+            return None
+        return track.get("reduced_svg_content", {}).get("1")
 
     @property
     def media_image_url(self) -> str | None:
         """Image url of current playing media."""
-        if not (track := self.device.track):
-            track = TRACKS.get(self.device.track_id)
-        if track and "image" in track:
-            return f"https://app.grounded.so/uploads/{track['image']}"
-        return None
+        device = self.device
+        if not (track := device.track):
+            track = TRACKS.get(device.track_id)
+        if not (track and (image := track.get("image"))):
+            return None
+        if image != (cache := self._image_url_cache)[0]:
+            cache = self._image_url_cache = (
+                image,
+                f"https://app.grounded.so/uploads/{image}",
+            )
+        return cache[1]
 
     @property
     def media_position(self) -> int:
@@ -75,11 +102,14 @@ class OasisMiniMediaPlayerEntity(OasisMiniEntity, MediaPlayerEntity):
     @property
     def media_title(self) -> str | None:
         """Title of current playing media."""
-        if not self.device.track_id:
+        device = self.device
+        if not (track_id := device.track_id):
             return None
-        if not (track := self.device.track):
-            track = TRACKS.get(self.device.track_id, {})
-        return track.get("name", f"Unknown Title (#{self.device.track_id})")
+        if not (track := device.track):
+            track = TRACKS.get(track_id, {})
+        if (name := track.get("name")) is not None:
+            return name
+        return f"Unknown Title (#{track_id})"
 
     @property
     def repeat(self) -> RepeatMode:
@@ -89,24 +119,14 @@ class OasisMiniMediaPlayerEntity(OasisMiniEntity, MediaPlayerEntity):
     @property
     def state(self) -> MediaPlayerState:
         """State of the player."""
-        status_code = self.device.status_code
-        if self.device.error or status_code in (9, 11):
+        device = self.device
+        if device.error:
             return MediaPlayerState.OFF
-        if status_code == 2:
-            return MediaPlayerState.IDLE
-        if status_code in (3, 13):
-            return MediaPlayerState.BUFFERING
-        if status_code == 4:
-            return MediaPlayerState.PLAYING
-        if status_code == 5:
-            return MediaPlayerState.PAUSED
-        if status_code == 15:
-            return MediaPlayerState.ON
-        return MediaPlayerState.IDLE
-
-    def abort_if_busy(self) -> None:
+        return STATE_MAP.get(device.status_code, MediaPlayerState.IDLE)
+
+    def abort_if_busy(self, device: OasisMini) -> None:
         """Abort if the device is currently busy."""
-        if self.device.busy:
+        if device.busy:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
                 translation_key="device_busy",
@@ -115,45 +135,51 @@ class OasisMiniMediaPlayerEntity(OasisMiniEntity, MediaPlayerEntity):
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
-        self.abort_if_busy()
-        await self.device.async_pause()
-        await self.coordinator.async_request_refresh()
+        device = self.device
+        self.abort_if_busy(device)
+        await device.async_pause()
+        self.async_push_device_state()
 
     async def async_media_play(self) -> None:
         """Send play command."""
-        self.abort_if_busy()
-        await self.device.async_play()
-        await self.coordinator.async_request_refresh()
+        device = self.device
+        self.abort_if_busy(device)
+        await device.async_play()
+        self.async_push_device_state()
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
-        self.abort_if_busy()
-        await self.device.async_stop()
-        await self.coordinator.async_request_refresh()
+        device = self.device
+        self.abort_if_busy(device)
+        await device.async_stop()
+        self.async_push_device_state()
 
     async def async_set_repeat(self, repeat: RepeatMode) -> None:
         """Set repeat mode."""
-        await self.device.async_set_repeat_playlist(
+        device = self.device
+        await device.async_set_repeat_playlist(
             repeat != RepeatMode.OFF
-            and not (repeat == RepeatMode.ONE and self.repeat == RepeatMode.ALL)
+            and not (repeat == RepeatMode.ONE and device.repeat_playlist)
         )
-        await self.coordinator.async_request_refresh()
+        self.async_push_device_state(refresh=False)
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
-        self.abort_if_busy()
-        if (index := self.device.playlist_index - 1) < 0:
-            index = len(self.device.playlist) - 1
-        await self.device.async_change_track(index)
-        await self.coordinator.async_request_refresh()
+        device = self.device
+        self.abort_if_busy(device)
+        if (index := device.playlist_index - 1) < 0:
+            index = len(device.playlist) - 1
+        await device.async_change_track(index)
+        self.async_push_device_state()
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
-        self.abort_if_busy()
-        if (index := self.device.playlist_index + 1) >= len(self.device.playlist):
+        device = self.device
+        self.abort_if_busy(device)
+        if (index := device.playlist_index + 1) >= len(device.playlist):
             index = 0
-        await self.device.async_change_track(index)
-        await self.coordinator.async_request_refresh()
+        await device.async_change_track(index)
+        self.async_push_device_state()
 
     async def async_play_media(
         self,
@@ -163,13 +189,14 @@ class OasisMiniMediaPlayerEntity(OasisMiniEntity, MediaPlayerEntity):
         **kwargs: Any,
     ) -> None:
         """Play a piece of media."""
-        self.abort_if_busy()
+        device = self.device
+        self.abort_if_busy(device)
         if media_type == MediaType.PLAYLIST:
             raise ServiceValidationError(
                 translation_domain=DOMAIN, translation_key="playlists_unsupported"
             )
         else:
-            track = list(filter(None, map(get_track_id, media_id.split(","))))
+            track = get_track_ids(media_id)
             if not track:
                 raise ServiceValidationError(
                     translation_domain=DOMAIN,
@@ -177,39 +204,26 @@ class OasisMiniMediaPlayerEntity(OasisMiniEntity, MediaPlayerEntity):
                     translation_placeholders={"media": media_id},
                 )
 
-        device = self.device
         enqueue = MediaPlayerEnqueue.NEXT if not enqueue else enqueue
         if enqueue == MediaPlayerEnqueue.REPLACE:
             await device.async_set_playlist(track)
-        else:
+            if device.status_code != STATUS_PLAYING:
+                await device.async_play()
+        elif enqueue == MediaPlayerEnqueue.ADD:
             await device.async_add_track_to_playlist(track)
+        else:
+            await add_and_play_track(
+                device, track, play=enqueue == MediaPlayerEnqueue.PLAY
+            )
 
-        if enqueue in (MediaPlayerEnqueue.NEXT, MediaPlayerEnqueue.PLAY):
-            # Move track to next item in the playlist
-            new_tracks = 1 if isinstance(track, int) else len(track)
-            if (index := (len(device.playlist) - new_tracks)) != device.playlist_index:
-                if index != (
-                    _next := min(
-                        device.playlist_index + 1, len(device.playlist) - new_tracks
-                    )
-                ):
-                    await device.async_move_track(index, _next)
-                if enqueue == MediaPlayerEnqueue.PLAY:
-                    await device.async_change_track(_next)
-
-        if (
-            enqueue in (MediaPlayerEnqueue.PLAY, MediaPlayerEnqueue.REPLACE)
-            and device.status_code != 4
-        ):
-            await device.async_play()
-
-        await self.coordinator.async_request_refresh()
+        self.async_push_device_state()
 
     async def async_clear_playlist(self) -> None:
         """Clear players playlist."""
-        self.abort_if_busy()
-        await self.device.async_clear_playlist()
-        await self.coordinator.async_request_refresh()
+        device = self.device
+        self.abort_if_busy(device)
+        await device.async_clear_playlist()
+        self.async_push_device_state()
 
 
 DESCRIPTOR = MediaPlayerEntityDescription(key="oasis_mini", name=None)
@@ -2,52 +2,126 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+import logging
+from operator import attrgetter
+from typing import Awaitable, Callable
+
 from homeassistant.components.number import (
     NumberEntity,
     NumberEntityDescription,
     NumberMode,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import OasisMiniConfigEntry
+from .coordinator import OasisMiniCoordinator
 from .entity import OasisMiniEntity
-from .pyoasismini import BALL_SPEED_MAX, BALL_SPEED_MIN, LED_SPEED_MAX, LED_SPEED_MIN
+from .pyoasismini import (
+    BALL_SPEED_MAX,
+    BALL_SPEED_MIN,
+    LED_SPEED_MAX,
+    LED_SPEED_MIN,
+    OasisMini,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Slider drags are coalesced so only the latest value is sent to the device
+WRITE_COOLDOWN = 0.2
+
+
+@dataclass(frozen=True, kw_only=True)
+class OasisMiniNumberEntityDescription(NumberEntityDescription):
+    """Oasis Mini number entity description."""
+
+    set_fn: Callable[[OasisMini, int], Awaitable[None]]
 
 
 class OasisMiniNumberEntity(OasisMiniEntity, NumberEntity):
     """Oasis Mini number entity."""
 
+    entity_description: OasisMiniNumberEntityDescription
+    _pending_value: int | None = None
+
+    def __init__(
+        self,
+        coordinator: OasisMiniCoordinator,
+        description: OasisMiniNumberEntityDescription,
+    ) -> None:
+        """Construct an Oasis Mini number entity."""
+        super().__init__(coordinator, description)
+        self._value_getter = attrgetter(description.key)
+        self._debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=WRITE_COOLDOWN,
+            immediate=False,
+            function=self._async_write_pending_value,
+        )
+
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> int | None:
         """Return the value reported by the number."""
-        return getattr(self.device, self.entity_description.key)
+        if self._pending_value is not None:
+            return self._pending_value
+        return self._value_getter(self.device)
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._debouncer.async_cancel)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
-        if self.entity_description.key == "ball_speed":
-            await self.device.async_set_ball_speed(value)
-        elif self.entity_description.key == "led_speed":
-            await self.device.async_set_led(led_speed=value)
-        await self.coordinator.async_request_refresh()
+        value = int(min(max(value, self.native_min_value), self.native_max_value))
+        if value == self.native_value:
+            return
+        self._pending_value = value
+        self.async_write_ha_state()
+        await self._debouncer.async_call()
 
+    async def _async_write_pending_value(self) -> None:
+        """Send pending values to the device until the latest one is written.
 
-DESCRIPTORS = {
-    NumberEntityDescription(
+        The debouncer drops calls made while a write is in flight, so values set
+        during a write are picked up here instead.
+        """
+        while (value := self._pending_value) is not None:
+            if value != self._value_getter(self.device):
+                try:
+                    await self.entity_description.set_fn(self.device, value)
+                except Exception as ex:  # pylint:disable=broad-except
+                    # The service call has already returned, so surface it here
+                    _LOGGER.error(
+                        "Failed to set %s to %s: %s", self.entity_id, value, ex
+                    )
+            if self._pending_value == value:
+                self._pending_value = None
+        # Also reverts the entity to the device value after a failed write
+        self.async_push_device_state(refresh=False)
+
+
+DESCRIPTORS = (
+    OasisMiniNumberEntityDescription(
         key="ball_speed",
         translation_key="ball_speed",
         mode=NumberMode.SLIDER,
         native_max_value=BALL_SPEED_MAX,
         native_min_value=BALL_SPEED_MIN,
+        set_fn=lambda device, value: device.async_set_ball_speed(value),
     ),
-    NumberEntityDescription(
+    OasisMiniNumberEntityDescription(
         key="led_speed",
         translation_key="led_speed",
         mode=NumberMode.SLIDER,
         native_max_value=LED_SPEED_MAX,
         native_min_value=LED_SPEED_MIN,
+        set_fn=lambda device, value: device.async_set_led(led_speed=value),
     ),
-}
+)
 
 
 async def async_setup_entry(
@@ -3,27 +3,50 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
+from itertools import chain
 import logging
 from typing import Any, Awaitable, Final
 from urllib.parse import urljoin
 
-from aiohttp import ClientResponseError, ClientSession
+from aiohttp import ClientResponseError, ClientSession, ClientTimeout, TCPConnector
+from yarl import URL
 
 from .const import TRACKS
 from .utils import _bit_to_bool, decrypt_svg_content
 
+try:
+    from orjson import dumps as _orjson_dumps, loads as json_loads
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return _orjson_dumps(obj).decode()
+
+except ImportError:  # pragma: no cover
+    from json import dumps as json_dumps, loads as json_loads
+
 _LOGGER = logging.getLogger(__name__)
 
+STATUS_BOOTING: Final = 0  # maybe?
+STATUS_STOPPED: Final = 2
+STATUS_CENTERING: Final = 3
+STATUS_PLAYING: Final = 4
+STATUS_PAUSED: Final = 5
+STATUS_ERROR: Final = 9
+STATUS_UPDATING: Final = 11
+STATUS_DOWNLOADING: Final = 13
+STATUS_LIVE: Final = 15
+
 STATUS_CODE_MAP = {
-    0: "booting",  # maybe?
-    2: "stopped",
-    3: "centering",
-    4: "playing",
-    5: "paused",
-    9: "error",
-    11: "updating",
-    13: "downloading",
-    15: "live",
+    STATUS_BOOTING: "booting",
+    STATUS_STOPPED: "stopped",
+    STATUS_CENTERING: "centering",
+    STATUS_PLAYING: "playing",
+    STATUS_PAUSED: "paused",
+    STATUS_ERROR: "error",
+    STATUS_UPDATING: "updating",
+    STATUS_DOWNLOADING: "downloading",
+    STATUS_LIVE: "live",
 }
 
 AUTOPLAY_MAP = {
@@ -59,11 +82,49 @@ BALL_SPEED_MIN: Final = 200
 LED_SPEED_MAX: Final = 90
 LED_SPEED_MIN: Final = -90
 
+# Concurrent cloud page fetches are batched to fit the per-host pool
+MAX_CONNECTIONS_PER_HOST: Final = 4
+
+# The device is on the local network, so fail fast when it can't be reached
+REQUEST_TIMEOUT: Final = ClientTimeout(total=30, sock_connect=5)
+
+# Parameter-less device commands, shared across requests
+_PARAMS_GET_IP: Final = {"GETIP": ""}
+_PARAMS_GET_MAC: Final = {"GETMAC": ""}
+_PARAMS_GET_SERIAL_NUMBER: Final = {"GETOASISID": ""}
+_PARAMS_GET_SOFTWARE_VERSION: Final = {"GETSOFTWAREVER": ""}
+_PARAMS_GET_STATUS: Final = {"GETSTATUS": ""}
+_PARAMS_PAUSE: Final = {"CMDPAUSE": ""}
+_PARAMS_PLAY: Final = {"CMDPLAY": ""}
+_PARAMS_REBOOT: Final = {"CMDBOOT": ""}
+_PARAMS_STOP: Final = {"CMDSTOP": ""}
+
+
+@lru_cache(maxsize=128)
+def _cloud_url(path: str) -> str:
+    """Return the cloud url for a path."""
+    return urljoin(CLOUD_BASE_URL, path)
+
+
+def _create_session() -> ClientSession:
+    """Create a session pooled for the device and the cloud host."""
+    return ClientSession(
+        connector=TCPConnector(
+            limit=8,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        ),
+        timeout=REQUEST_TIMEOUT,
+        json_serialize=json_dumps,
+    )
+
 
 class OasisMini:
     """Oasis Mini API client class."""
 
     _access_token: str | None = None
+    _auth_headers: dict[str, str] | None = None
     _mac_address: str | None = None
     _ip_address: str | None = None
     _playlist: dict[int, dict[str, str]] = {}
@@ -72,6 +133,7 @@ class OasisMini:
     _track: dict | None = None
 
     autoplay: str
+    ball_speed: int
     brightness: int
     busy: bool
     color: str | None = None
@@ -94,14 +156,22 @@ class OasisMini:
     ) -> None:
         """Initialize the client."""
         self._host = host
-        self._access_token = access_token
-        self._session = session if session else ClientSession()
+        self._url = URL(f"http://{host}/")
+        self.access_token = access_token
+        self._track_cache: dict[int, dict[str, Any]] = {}
+        self._session = session if session else _create_session()
 
     @property
     def access_token(self) -> str | None:
         """Return the access token, if any."""
         return self._access_token
 
+    @access_token.setter
+    def access_token(self, value: str | None) -> None:
+        """Set the access token and the cloud authorization header."""
+        self._access_token = value
+        self._auth_headers = {"Authorization": f"Bearer {value}"} if value else None
+
     @property
     def mac_address(self) -> str | None:
         """Return the mac address."""
@@ -154,9 +224,9 @@ class OasisMini:
         return self.playlist[0] if i >= len(self.playlist) else self.playlist[i]
 
     @property
-    def url(self) -> str:
+    def url(self) -> URL:
         """Return the url."""
-        return f"http://{self._host}/"
+        return self._url
 
     async def async_add_track_to_playlist(self, track: int | list[int]) -> None:
         """Add track to playlist."""
@@ -175,6 +245,7 @@ class OasisMini:
         if index >= len(self.playlist):
             raise ValueError("Invalid index specified")
         await self._async_command(params={"CMDCHANGETRACK": index})
+        self.playlist_index = index
 
     async def async_clear_playlist(self) -> None:
         """Clear the playlist."""
@@ -182,31 +253,33 @@ class OasisMini:
 
     async def async_get_ip_address(self) -> str | None:
         """Get the ip address."""
-        self._ip_address = await self._async_get(params={"GETIP": ""})
+        self._ip_address = await self._async_get(params=_PARAMS_GET_IP)
         _LOGGER.debug("IP address: %s", self._ip_address)
         return self._ip_address
 
     async def async_get_mac_address(self) -> str | None:
         """Get the mac address."""
-        self._mac_address = await self._async_get(params={"GETMAC": ""})
+        self._mac_address = await self._async_get(params=_PARAMS_GET_MAC)
         _LOGGER.debug("MAC address: %s", self._mac_address)
         return self._mac_address
 
     async def async_get_serial_number(self) -> str | None:
         """Get the serial number."""
-        self._serial_number = await self._async_get(params={"GETOASISID": ""})
+        self._serial_number = await self._async_get(params=_PARAMS_GET_SERIAL_NUMBER)
         _LOGGER.debug("Serial number: %s", self._serial_number)
         return self._serial_number
 
     async def async_get_software_version(self) -> str | None:
         """Get the software version."""
-        self._software_version = await self._async_get(params={"GETSOFTWAREVER": ""})
+        self._software_version = await self._async_get(
+            params=_PARAMS_GET_SOFTWARE_VERSION
+        )
         _LOGGER.debug("Software version: %s", self._software_version)
         return self._software_version
 
     async def async_get_status(self) -> str:
         """Get the status from the device."""
-        raw_status = await self._async_get(params={"GETSTATUS": ""})
+        raw_status = await self._async_get(params=_PARAMS_GET_STATUS)
         _LOGGER.debug("Status: %s", raw_status)
         values = raw_status.split(";")
         playlist = [int(track) for track in values[3].split(",") if track]
@@ -243,17 +316,20 @@ class OasisMini:
     async def async_move_track(self, _from: int, _to: int) -> None:
         """Move a track in the playlist."""
         await self._async_command(params={"MOVEJOB": f"{_from};{_to}"})
+        self.playlist.insert(_to, self.playlist.pop(_from))
 
     async def async_pause(self) -> None:
         """Send pause command."""
-        await self._async_command(params={"CMDPAUSE": ""})
+        await self._async_command(params=_PARAMS_PAUSE)
+        self.status_code = STATUS_PAUSED
 
     async def async_play(self) -> None:
         """Send play command."""
-        if self.status_code == 15:
+        if self.status_code == STATUS_LIVE:
             await self.async_stop()
         if self.track_id:
-            await self._async_command(params={"CMDPLAY": ""})
+            await self._async_command(params=_PARAMS_PLAY)
+            self.status_code = STATUS_PLAYING
 
     async def async_reboot(self) -> None:
         """Send reboot command."""
@@ -264,7 +340,7 @@ class OasisMini:
             except Exception as ex:
                 _LOGGER.error(ex)
 
-        reboot = self._async_command(params={"CMDBOOT": ""})
+        reboot = self._async_command(params=_PARAMS_REBOOT)
         asyncio.create_task(_no_response_needed(reboot))
 
     async def async_set_ball_speed(self, speed: int) -> None:
@@ -273,6 +349,7 @@ class OasisMini:
             raise ValueError("Invalid speed specified")
 
         await self._async_command(params={"WRIOASISSPEED": speed})
+        self.ball_speed = speed
 
     async def async_set_led(
         self,
@@ -302,6 +379,10 @@ class OasisMini:
         await self._async_command(
             params={"WRILED": f"{led_effect};0;{color};{led_speed};{brightness}"}
         )
+        self.led_effect = led_effect
+        self.color = color
+        self.led_speed = led_speed
+        self.brightness = brightness
 
     async def async_set_autoplay(self, option: bool | int | str) -> None:
         """Set autoplay."""
@@ -315,7 +396,7 @@ class OasisMini:
         """Set the playlist."""
         if isinstance(playlist, int):
             playlist = [playlist]
-        if is_playing := (self.status_code == 4):
+        if is_playing := (self.status_code == STATUS_PLAYING):
             await self.async_stop()
         await self._async_command(params={"WRIJOBLIST": ",".join(map(str, playlist))})
         self.playlist = playlist
@@ -325,10 +406,12 @@ class OasisMini:
     async def async_set_repeat_playlist(self, repeat: bool) -> None:
         """Set repeat playlist."""
         await self._async_command(params={"WRIREPEATJOB": 1 if repeat else 0})
+        self.repeat_playlist = repeat
 
     async def async_stop(self) -> None:
         """Send stop command."""
-        await self._async_command(params={"CMDSTOP": ""})
+        await self._async_command(params=_PARAMS_STOP)
+        self.status_code = STATUS_STOPPED
 
     async def async_upgrade(self, beta: bool = False) -> None:
         """Trigger a software upgrade."""
@@ -338,10 +421,10 @@ class OasisMini:
         """Login via the cloud."""
         response = await self._async_request(
             "POST",
-            urljoin(CLOUD_BASE_URL, "api/auth/login"),
+            _cloud_url("api/auth/login"),
             json={"email": email, "password": password},
         )
-        self._access_token = response.get("access_token")
+        self.access_token = response.get("access_token")
 
     async def async_cloud_logout(self) -> None:
         """Login via the cloud."""
@@ -349,14 +432,23 @@ class OasisMini:
 
     async def async_cloud_get_track_info(self, track_id: int) -> dict[str, Any] | None:
         """Get cloud track info."""
+        if track := self._track_cache.get(track_id):
+            return track
         try:
-            return await self._async_cloud_request("GET", f"api/track/{track_id}")
+            track = await self._async_cloud_request("GET", f"api/track/{track_id}")
         except ClientResponseError as err:
             if err.status == 404:
+                # Not cached, so a track published later still resolves
                 return {"id": track_id, "name": f"Unknown Title (#{track_id})"}
         except Exception as ex:
             _LOGGER.exception(ex)
-        return None
+        if track:
+            self._track_cache[track_id] = track
+        return track
+
+    def invalidate_track(self, track_id: int) -> None:
+        """Drop cached cloud track info so the next lookup fetches it again."""
+        self._track_cache.pop(track_id, None)
 
     async def async_cloud_get_tracks(
         self, tracks: list[int] | None = None
@@ -368,9 +460,38 @@ class OasisMini:
         if not response:
             return None
         track_details = response.get("data", [])
-        while next_page_url := response.get("next_page_url"):
+        if not (next_page_url := response.get("next_page_url")):
+            return track_details
+
+        # Fetch the remaining pages concurrently when the page count is known
+        if last_page := response.get("last_page"):
+            next_page = URL(next_page_url)
+            pages = range(response.get("current_page", 1) + 1, last_page + 1)
+            responses = []
+            # Queued requests would count the wait for a pooled connection
+            # against the request timeout, so never exceed the per-host limit
+            for start in range(0, len(pages), MAX_CONNECTIONS_PER_HOST):
+                responses += await asyncio.gather(
+                    *(
+                        self._async_cloud_request(
+                            "GET", str(next_page.update_query(page=page))
+                        )
+                        for page in pages[start : start + MAX_CONNECTIONS_PER_HOST]
+                    )
+                )
+            return list(
+                chain(
+                    track_details,
+                    chain.from_iterable(
+                        response.get("data", []) for response in responses
+                    ),
+                )
+            )
+
+        while next_page_url:
             response = await self._async_cloud_request("GET", next_page_url)
             track_details += response.get("data", [])
+            next_page_url = response.get("next_page_url")
         return track_details
 
     async def async_cloud_get_latest_software_details(self) -> dict[str, int | str]:
@@ -412,14 +533,13 @@ class OasisMini:
 
     async def _async_cloud_request(self, method: str, url: str, **kwargs: Any) -> Any:
         """Perform a cloud request."""
-        if not self.access_token:
+        if not (headers := self._auth_headers):
             return
 
+        if extra := kwargs.pop("headers", None):
+            headers = {**headers, **extra}
         return await self._async_request(
-            method,
-            urljoin(CLOUD_BASE_URL, url),
-            headers={"Authorization": f"Bearer {self.access_token}"},
-            **kwargs,
+            method, _cloud_url(url), headers=headers, **kwargs
         )
 
     async def _async_command(self, **kwargs: Any) -> str | None:
@@ -431,19 +551,18 @@ class OasisMini:
         """Perform a GET request."""
         return await self._async_request("GET", self.url, **kwargs)
 
-    async def _async_request(self, method: str, url: str, **kwargs) -> Any:
+    async def _async_request(self, method: str, url: str | URL, **kwargs) -> Any:
         """Perform a request."""
-        _LOGGER.debug(
-            "%s %s",
-            method,
-            self._session._build_url(url).update_query(  # pylint: disable=protected-access
-                kwargs.get("params")
-            ),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s %s",
+                method,
+                URL(url).update_query(kwargs.get("params")),
+            )
         response = await self._session.request(method, url, **kwargs)
         if response.status == 200:
             if response.content_type == "application/json":
-                return await response.json()
+                return await response.json(loads=json_loads)
             if response.content_type == "text/plain":
                 return await response.text()
             return None
@@ -39,7 +39,7 @@ class OasisMiniSelectEntity(OasisMiniEntity, SelectEntity):
     ) -> None:
         """Construct an Oasis Mini select entity."""
         super().__init__(coordinator, description)
-        self._handle_coordinator_update()
+        self._update_attrs()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -49,9 +49,15 @@ class OasisMiniSelectEntity(OasisMiniEntity, SelectEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if self._update_attrs():
+            super()._handle_coordinator_update()
+
+    @callback
+    def _update_attrs(self) -> bool:
+        """Update the select attributes from the device, if changed."""
         new_value = self.entity_description.current_value(self.device)
         if self._current_value == new_value:
-            return
+            return False
         self._current_value = new_value
         if update_handler := self.entity_description.update_handler:
             update_handler(self)
@@ -59,8 +65,7 @@ class OasisMiniSelectEntity(OasisMiniEntity, SelectEntity):
             self._attr_current_option = getattr(
                 self.device, self.entity_description.key
             )
-        if self.hass:
-            return super()._handle_coordinator_update()
+        return True
 
 
 def playlist_update_handler(entity: OasisMiniSelectEntity) -> None:
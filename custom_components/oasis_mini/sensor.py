@@ -36,7 +36,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-DESCRIPTORS = {
+DESCRIPTORS = (
     SensorEntityDescription(
         key="download_progress",
         translation_key="download_progress",
@@ -45,15 +45,16 @@ DESCRIPTORS = {
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-} | {
-    SensorEntityDescription(
-        key=key,
-        translation_key=key,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_registry_enabled_default=False,
-    )
-    for key in ("error", "led_color_id", "status")
-}
+    *(
+        SensorEntityDescription(
+            key=key,
+            translation_key=key,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        )
+        for key in ("error", "led_color_id", "status")
+    ),
+)
 
 CLOUD_DESCRIPTORS = (
     SensorEntityDescription(
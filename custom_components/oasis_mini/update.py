@@ -18,6 +18,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import OasisMiniConfigEntry
 from .coordinator import OasisMiniCoordinator
 from .entity import OasisMiniEntity
+from .pyoasismini import STATUS_UPDATING
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,7 +51,7 @@ class OasisMiniUpdateEntity(OasisMiniEntity, UpdateEntity):
     @property
     def in_progress(self) -> bool | int:
         """Update installation progress."""
-        if self.device.status_code == 11:
+        if self.device.status_code == STATUS_UPDATING:
             return self.device.download_progress
         return False
 